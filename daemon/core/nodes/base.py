@@ -566,7 +566,8 @@ class CoreNode(CoreNodeBase):
             logging.debug("node(%s) pid: %s", self.name, self.pid)
 
             # create vnode client
-            self.client = client.VnodeClient(self.name, self.ctrlchnlname)
+            persistent = self.session.options.get_config("persistent_cmd") != "False"
+            self.client = client.VnodeClient(self.name, self.ctrlchnlname, persistent)
 
             # bring up the loopback interface
             logging.debug("bringing up loopback interface")
@@ -603,6 +604,9 @@ class CoreNode(CoreNodeBase):
                 for netif in self.netifs():
                     netif.shutdown()
 
+                # close client, before the node process goes away
+                self.client.close()
+
                 # kill node process if present
                 try:
                     self.host_cmd(f"kill -9 {self.pid}")
@@ -615,9 +619,8 @@ class CoreNode(CoreNodeBase):
                 except CoreCommandError:
                     logging.exception("error removing node directory")
 
-                # clear interface data, close client, and mark self and not up
+                # clear interface data and mark self and not up
                 self._netif.clear()
-                self.client.close()
                 self.up = False
             except OSError:
                 logging.exception("error during shutdown")
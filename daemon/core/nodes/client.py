@@ -4,8 +4,163 @@ over a control channel to the vnoded process running in a network namespace.
 The control channel can be accessed via calls using the vcmd shell.
 """
 
+import logging
+import os
+import re
+import selectors
+import shlex
+import threading
+import uuid
+from subprocess import PIPE, Popen
+from typing import Optional, Tuple
+
 from core import utils
 from core.constants import VCMD_BIN
+from core.errors import CoreCommandError
+
+
+class VnodeExecutor:
+    """
+    Long lived shell running within a node, started once through vcmd, that
+    commands are written to instead of spawning a new vcmd process per command.
+    """
+
+    def __init__(self, name: str, ctrlchnlname: str) -> None:
+        """
+        Create a VnodeExecutor instance.
+
+        :param name: name for executor
+        :param ctrlchnlname: control channel name
+        """
+        self.name = name
+        self.ctrlchnlname = ctrlchnlname
+        self.lock = threading.Lock()
+        self.process = None
+        self.marker = f"CORE-{uuid.uuid4().hex}"
+        self.stdout_end = re.compile(rf"\n{self.marker} (\d+)\n".encode("utf-8"))
+        self.stderr_end = f"\n{self.marker}\n".encode("utf-8")
+
+    def running(self) -> bool:
+        """
+        Check if the executor shell is currently running.
+
+        :return: True if running, False otherwise
+        """
+        return self.process is not None and self.process.poll() is None
+
+    def start(self) -> None:
+        """
+        Start the executor shell within the node and verify it responds.
+
+        :return: nothing
+        :raises CoreCommandError: when the shell fails to start or respond
+        """
+        args = [VCMD_BIN, "-c", self.ctrlchnlname, "--", "/bin/sh"]
+        try:
+            self.process = Popen(args, stdin=PIPE, stdout=PIPE, stderr=PIPE)
+        except OSError:
+            self.process = None
+            raise CoreCommandError(-1, args)
+        status, _, _ = self._run("true")
+        if status != 0:
+            self.stop()
+            raise CoreCommandError(status, args)
+        logging.debug("node(%s) started persistent executor", self.name)
+
+    def stop(self) -> None:
+        """
+        Stop the executor shell.
+
+        :return: nothing
+        """
+        if self.process is None:
+            return
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+        try:
+            self.process.wait(timeout=1)
+        except Exception:
+            self.process.kill()
+            self.process.wait()
+        self.process.stdout.close()
+        self.process.stderr.close()
+        self.process = None
+
+    def _run(self, args: str) -> Tuple[int, bytes, bytes]:
+        """
+        Write a command to the executor shell and read back its result, which
+        is delimited by a marker line on both stdout and stderr.
+
+        :param args: shell command line to run
+        :return: exit status, stdout, and stderr
+        :raises CoreCommandError: when the executor shell fails while running
+        """
+        script = (
+            f"( {args} ) </dev/null\n"
+            f"printf '\\n%s %d\\n' {self.marker} $?\n"
+            f"printf '\\n%s\\n' {self.marker} >&2\n"
+        )
+        try:
+            self.process.stdin.write(script.encode("utf-8"))
+            self.process.stdin.flush()
+        except OSError:
+            self.stop()
+            raise CoreCommandError(-1, args)
+
+        stdout_fd = self.process.stdout.fileno()
+        stderr_fd = self.process.stderr.fileno()
+        buffers = {stdout_fd: bytearray(), stderr_fd: bytearray()}
+        status = None
+        stdout = stderr = None
+        with selectors.DefaultSelector() as selector:
+            selector.register(stdout_fd, selectors.EVENT_READ)
+            selector.register(stderr_fd, selectors.EVENT_READ)
+            while stdout is None or stderr is None:
+                for key, _ in selector.select():
+                    fd = key.fd
+                    data = os.read(fd, 65536)
+                    if not data:
+                        self.stop()
+                        raise CoreCommandError(-1, args)
+                    buffer = buffers[fd]
+                    buffer.extend(data)
+                    if fd == stdout_fd:
+                        match = self.stdout_end.search(buffer)
+                        if match:
+                            status = int(match.group(1))
+                            stdout = bytes(buffer[: match.start()])
+                            selector.unregister(fd)
+                    elif buffer.endswith(self.stderr_end):
+                        stderr = bytes(buffer[: -len(self.stderr_end)])
+                        selector.unregister(fd)
+        return status, stdout, stderr
+
+    def run(self, args: str) -> Optional[str]:
+        """
+        Run a command within the executor shell, when it is not already busy
+        running another command.
+
+        :param args: command to run
+        :return: combined stdout and stderr, None when the executor is busy
+        :raises CoreCommandError: when there is a non-zero exit status
+        """
+        if not self.lock.acquire(blocking=False):
+            return None
+        try:
+            if not self.running():
+                self.start()
+            logging.debug("node(%s) executor command: %s", self.name, args)
+            split_args = shlex.split(args)
+            status, stdout, stderr = self._run(
+                " ".join(shlex.quote(x) for x in split_args)
+            )
+            if status != 0:
+                raise CoreCommandError(status, split_args, stdout, stderr)
+            return stdout.decode("utf-8").strip()
+        finally:
+            self.lock.release()
 
 
 class VnodeClient:
@@ -13,15 +168,20 @@ class VnodeClient:
     Provides client functionality for interacting with a virtual node.
     """
 
-    def __init__(self, name: str, ctrlchnlname: str) -> None:
+    def __init__(self, name: str, ctrlchnlname: str, persistent: bool = False) -> None:
         """
         Create a VnodeClient instance.
 
         :param name: name for client
         :param ctrlchnlname: control channel name
+        :param persistent: True to run commands over a persistent executor,
+            False to run a vcmd process per command
         """
         self.name = name
         self.ctrlchnlname = ctrlchnlname
+        self.executor = None
+        if persistent:
+            self.executor = VnodeExecutor(name, ctrlchnlname)
 
     def _verify_connection(self) -> None:
         """
@@ -47,11 +207,37 @@ class VnodeClient:
 
         :return: nothing
         """
-        pass
+        if self.executor:
+            self.executor.stop()
 
     def create_cmd(self, args: str) -> str:
         return f"{VCMD_BIN} -c {self.ctrlchnlname} -- {args}"
 
+    def _executor_cmd(self, args: str) -> Optional[str]:
+        """
+        Attempt to run a command using the persistent executor, disabling the
+        executor when it cannot be started.
+
+        :param args: command to run
+        :return: combined stdout and stderr, None when the executor was not used
+        :raises core.CoreCommandError: when there is a non-zero exit status
+        """
+        executor = self.executor
+        if executor is None:
+            return None
+        if not executor.running():
+            try:
+                return executor.run(args)
+            except CoreCommandError:
+                if executor.running():
+                    raise
+                logging.warning(
+                    "node(%s) persistent executor unavailable, using vcmd", self.name
+                )
+                self.executor = None
+                return None
+        return executor.run(args)
+
     def check_cmd(self, args: str, wait: bool = True, shell: bool = False) -> str:
         """
         Run command and return exit status and combined stdout and stderr.
@@ -63,5 +249,9 @@ class VnodeClient:
         :raises core.CoreCommandError: when there is a non-zero exit status
         """
         self._verify_connection()
+        if wait and not shell:
+            output = self._executor_cmd(args)
+            if output is not None:
+                return output
         args = self.create_cmd(args)
         return utils.cmd(args, wait=wait, shell=shell)
@@ -144,6 +144,72 @@ class LinuxNetClient:
         """
         self.run(f"{TC_BIN} qdisc delete dev {device} root")
 
+    def set_tbf(self, device: str, rate: float, burst: float, limit: int) -> None:
+        """
+        Set the root token bucket filter queuing discipline for a device.
+
+        :param device: device to set tbf for
+        :param rate: rate in bits per second
+        :param burst: burst size in bytes
+        :param limit: limit of bytes that can be queued
+        :return: nothing
+        """
+        self.run(
+            f"{TC_BIN} qdisc replace dev {device} root handle 1: "
+            f"tbf rate {rate} burst {burst} limit {limit}"
+        )
+
+    def set_netem(
+        self,
+        device: str,
+        parent: str = None,
+        delay: float = None,
+        jitter: float = None,
+        loss: float = None,
+        duplicate: int = None,
+    ) -> None:
+        """
+        Set the netem queuing discipline for a device.
+
+        :param device: device to set netem for
+        :param parent: parent queuing discipline handle, default is None for root
+        :param delay: packet delay in microseconds
+        :param jitter: packet jitter in microseconds
+        :param loss: packet loss percentage
+        :param duplicate: packet duplicate percentage
+        :return: nothing
+        """
+        parent = f"parent {parent}" if parent else "root"
+        netem = "netem"
+        # jitter and delay use the same delay statement
+        if delay is not None:
+            netem += f" delay {delay}us"
+        if jitter is not None:
+            if delay is None:
+                netem += f" delay 0us {jitter}us 25%"
+            else:
+                netem += f" {jitter}us 25%"
+        if loss is not None and loss > 0:
+            netem += f" loss {min(loss, 100)}%"
+        if duplicate is not None and duplicate > 0:
+            netem += f" duplicate {min(duplicate, 100)}%"
+        self.run(f"{TC_BIN} qdisc replace dev {device} {parent} handle 10: {netem}")
+
+    def delete_qdisc(self, device: str, parent: str = None, handle: str = None) -> None:
+        """
+        Delete a queuing discipline from a device.
+
+        :param device: device to delete queuing discipline from
+        :param parent: parent queuing discipline handle, default is None for root
+        :param handle: handle of queuing discipline to delete
+        :return: nothing
+        """
+        cmd = f"{TC_BIN} qdisc delete dev {device}"
+        cmd += f" parent {parent}" if parent else " root"
+        if handle is not None:
+            cmd += f" handle {handle}"
+        self.run(cmd)
+
     def checksums_off(self, interface_name: str) -> None:
         """
         Turns interface checksums off.
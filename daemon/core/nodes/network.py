@@ -10,7 +10,7 @@ from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Type
 import netaddr
 
 from core import utils
-from core.constants import EBTABLES_BIN, TC_BIN
+from core.constants import EBTABLES_BIN
 from core.emulator.data import LinkData, NodeData
 from core.emulator.enumerations import LinkTypes, NodeTypes, RegisterTlvs
 from core.errors import CoreCommandError, CoreError
@@ -466,8 +466,7 @@ class CoreNetwork(CoreNetworkBase):
         """
         if devname is None:
             devname = netif.localname
-        tc = f"{TC_BIN} qdisc replace dev {devname}"
-        parent = "root"
+        parent = None
         changed = False
         if netif.setparam("bw", bw):
             # from tc-tbf(8): minimum value for burst is rate / kernel_hz
@@ -475,24 +474,20 @@ class CoreNetwork(CoreNetworkBase):
                 burst = max(2 * netif.mtu, bw / 1000)
                 # max IP payload
                 limit = 0xFFFF
-                tbf = f"tbf rate {bw} burst {burst} limit {limit}"
             if bw > 0:
                 if self.up:
-                    cmd = f"{tc} {parent} handle 1: {tbf}"
-                    netif.host_cmd(cmd)
+                    netif.net_client.set_tbf(devname, bw, burst, limit)
                 netif.setparam("has_tbf", True)
                 changed = True
             elif netif.getparam("has_tbf") and bw <= 0:
                 if self.up:
-                    cmd = f"{TC_BIN} qdisc delete dev {devname} {parent}"
-                    netif.host_cmd(cmd)
+                    netif.net_client.delete_qdisc(devname)
                 netif.setparam("has_tbf", False)
                 # removing the parent removes the child
                 netif.setparam("has_netem", False)
                 changed = True
         if netif.getparam("has_tbf"):
-            parent = "parent 1:1"
-        netem = "netem"
+            parent = "1:1"
         changed = max(changed, netif.setparam("delay", delay))
         if loss is not None:
             loss = float(loss)
@@ -503,19 +498,6 @@ class CoreNetwork(CoreNetworkBase):
         changed = max(changed, netif.setparam("jitter", jitter))
         if not changed:
             return
-        # jitter and delay use the same delay statement
-        if delay is not None:
-            netem += f" delay {delay}us"
-        if jitter is not None:
-            if delay is None:
-                netem += f" delay 0us {jitter}us 25%"
-            else:
-                netem += f" {jitter}us 25%"
-
-        if loss is not None and loss > 0:
-            netem += f" loss {min(loss, 100)}%"
-        if duplicate is not None and duplicate > 0:
-            netem += f" duplicate {min(duplicate, 100)}%"
 
         delay_check = delay is None or delay <= 0
         jitter_check = jitter is None or jitter <= 0
@@ -526,15 +508,13 @@ class CoreNetwork(CoreNetworkBase):
             if not netif.getparam("has_netem"):
                 return
             if self.up:
-                cmd = f"{TC_BIN} qdisc delete dev {devname} {parent} handle 10:"
-                netif.host_cmd(cmd)
+                netif.net_client.delete_qdisc(devname, parent, "10:")
             netif.setparam("has_netem", False)
-        elif len(netem) > 1:
+        else:
             if self.up:
-                cmd = (
-                    f"{TC_BIN} qdisc replace dev {devname} {parent} handle 10: {netem}"
+                netif.net_client.set_netem(
+                    devname, parent, delay, jitter, loss, duplicate
                 )
-                netif.host_cmd(cmd)
             netif.setparam("has_netem", True)
 
     def linknet(self, net: CoreNetworkBase) -> CoreInterface: